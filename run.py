@@ -5,10 +5,20 @@ import sys
 
 from src.jazzbot.bot import main
 
+# uvloop is optional and not available on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # asyncio.Runner (Python 3.11+) takes a loop factory directly
+        if uvloop is not None and hasattr(asyncio, "Runner"):
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nShutting down JazzBot...")
         sys.exit(0)
-
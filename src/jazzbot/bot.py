@@ -1,5 +1,6 @@
 """Main bot file for JazzBot."""
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -26,23 +27,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Generic failure response, built once and reused
+_EMBED_INTERACTION_ERROR = error_embed(
+    "An Error Occurred",
+    "Something went wrong while processing your command.",
+)
+
 
 class JazzBot(commands.Bot):
     """Main bot class for JazzBot."""
 
     def __init__(self) -> None:
         """Initialize the bot."""
-        intents = discord.Intents.default()
-        intents.message_content = True  # No message content needed
+        # Slash commands only need guild and voice state events
+        intents = discord.Intents.none()
+        intents.guilds = True
         intents.voice_states = True
 
+        # Only cache members that are in voice; channel member counts rely on it
+        member_cache_flags = discord.MemberCacheFlags.none()
+        member_cache_flags.voice = True
+
         super().__init__(
             command_prefix="!",  # Not used, but required by commands.Bot
             intents=intents,
             help_command=None,  # Disable default help command
+            member_cache_flags=member_cache_flags,
+            chunk_guilds_at_startup=False,
+            max_messages=None,  # No message cache needed
         )
 
         self.initial_extensions = ["src.jazzbot.commands"]
+        self.lavalink_task: Optional[asyncio.Task] = None
+        self._lavalink_lock = asyncio.Lock()
 
     async def setup_hook(self) -> None:
         """Setup hook called when bot is starting."""
@@ -54,6 +71,9 @@ class JazzBot(commands.Bot):
             except Exception as e:
                 logger.error(f"Failed to load extension {extension}: {e}")
 
+        # Connect to Lavalink in the background so it overlaps the gateway login
+        self.lavalink_task = asyncio.create_task(self.connect_lavalink())
+
         # Sync slash commands
         try:
             synced = await self.tree.sync()
@@ -65,27 +85,46 @@ class JazzBot(commands.Bot):
         """Called when bot is ready."""
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")  # type: ignore
         logger.info(f"Connected to {len(self.guilds)} guild(s)")
-        
-        # Connect to Lavalink
-        await self.connect_lavalink()
 
         # Change status
         await self.change_presence(activity=discord.Streaming(name="Music Playlist", url="https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=RDdQw4w9WgXcQ&start_radio=1&pp=ygUXbmV2ZXIgZ29ubmEgZ2l2ZSB5b3UgdXCgBwE%3D"))
 
     async def connect_lavalink(self) -> None:
-        """Connect to Lavalink server."""
-        try:
-            # Use http:// for local Lavalink servers (most use HTTP, not HTTPS)
-            nodes = [
-                wavelink.Node(
-                    uri=f"https://{Config.LAVALINK_HOST}:{Config.LAVALINK_PORT}",
-                    password=Config.LAVALINK_PASSWORD,
+        """
+        Connect to Lavalink server.
+
+        Wavelink nodes retry an unreachable server indefinitely by default,
+        so this waits out a Lavalink that is still starting. Failures it does
+        not retry (bad password, wrong endpoint) are logged once, since
+        retrying cannot fix them.
+        """
+        # Serialized so overlapping calls cannot both pass the check and connect
+        async with self._lavalink_lock:
+            if wavelink.Pool.nodes:
+                return  # Already connected
+
+            try:
+                # Use http:// for local Lavalink servers (most use HTTP, not HTTPS)
+                nodes = [
+                    wavelink.Node(
+                        uri=f"https://{Config.LAVALINK_HOST}:{Config.LAVALINK_PORT}",
+                        password=Config.LAVALINK_PASSWORD,
+                    )
+                ]
+                await wavelink.Pool.connect(nodes=nodes, client=self)
+            except Exception as e:
+                logger.error(f"Failed to connect to Lavalink: {e}")
+                return
+
+            # Pool.connect logs and skips nodes rejected for auth or 404 errors
+            if not wavelink.Pool.nodes:
+                logger.error(
+                    "Failed to connect to Lavalink: check LAVALINK_HOST, "
+                    "LAVALINK_PORT and LAVALINK_PASSWORD"
                 )
-            ]
-            await wavelink.Pool.connect(nodes=nodes, client=self)
+                return
+
             logger.info("Connected to Lavalink server")
-        except Exception as e:
-            logger.error(f"Failed to connect to Lavalink: {e}")
 
     async def on_wavelink_node_ready(
         self, payload: wavelink.NodeReadyEventPayload
@@ -121,19 +160,9 @@ class JazzBot(commands.Bot):
         logger.error(f"Interaction error: {error}", exc_info=error)
 
         if interaction.response.is_done():
-            await interaction.followup.send(
-                embed=error_embed(
-                    "An Error Occurred",
-                    "Something went wrong while processing your command.",
-                )
-            )
+            await interaction.followup.send(embed=_EMBED_INTERACTION_ERROR)
         else:
-            await interaction.response.send_message(
-                embed=error_embed(
-                    "An Error Occurred",
-                    "Something went wrong while processing your command.",
-                )
-            )
+            await interaction.response.send_message(embed=_EMBED_INTERACTION_ERROR)
 
 
 async def main() -> None:
@@ -151,7 +180,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
 
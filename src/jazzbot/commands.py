@@ -2,11 +2,14 @@
 
 import asyncio
 import logging
-from typing import Optional
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, List, Literal, Optional, Tuple, TypeVar
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import Button, View
 import wavelink
 
@@ -22,6 +25,103 @@ from .queue import MusicQueue, QueueEntry
 from .spotify import SpotifyResolver
 from .voice import ensure_bot_voice_state, validate_voice_context
 
+logger = logging.getLogger(__name__)
+
+TrackSource = Literal["Spotify", "YouTube"]
+
+# Search results are reused for repeat queries within this window
+_SEARCH_CACHE_TTL = 300.0  # seconds
+_SEARCH_CACHE_SIZE = 512
+
+# Queries starting with these are passed to Lavalink unchanged
+_URL_PREFIXES = ("http://", "https://", "ytsearch:", "scsearch:")
+
+# Playlist imports are capped in size and in how many searches they run at
+# once, so one import cannot hold every search permit
+_MAX_PLAYLIST_TRACKS = 200
+_PLAYLIST_SEARCH_CONCURRENCY = 2
+
+# Voice connection attempts; retries back off exponentially from the base delay
+_VOICE_CONNECT_TIMEOUT = 10.0  # seconds, Wavelink's default handshake allowance
+_VOICE_CONNECT_ATTEMPTS = 3
+_VOICE_CONNECT_BACKOFF = 0.2  # seconds
+
+# Empty voice channels are left after this long, checked every interval
+_EMPTY_CHANNEL_TIMEOUT = 600.0  # seconds
+_EMPTY_CHANNEL_CHECK_INTERVAL = 30.0  # seconds
+
+# Static responses, built once and reused
+_EMBED_NOT_PLAYING = error_embed("Not Playing", "No track is currently playing.")
+_EMBED_NOT_PAUSED = error_embed("Not Paused", "Playback is not paused.")
+_EMBED_ALREADY_PAUSED = error_embed("Already Paused", "Playback is already paused.")
+_EMBED_EMPTY_QUEUE = error_embed("Empty Queue", "The queue is empty.")
+_EMBED_EMPTY_QUEUE_INFO = info_embed("Queue", "The queue is empty.")
+_EMBED_TRACK_NOT_FOUND = error_embed("Track Not Found", "Could not find the requested track.")
+_EMBED_CANNOT_SHUFFLE = warning_embed("Cannot Shuffle", "Need at least 2 tracks to shuffle.")
+_EMBED_PAUSED = success_embed("Paused", "Playback has been paused.")
+_EMBED_RESUMED = success_embed("Resumed", "Playback has been resumed.")
+_EMBED_SHUFFLED = success_embed("Shuffled", "The queue has been shuffled.")
+_EMBED_DISCONNECTED = success_embed("Disconnected", "Left the voice channel and cleared the queue.")
+
+_HELP_LINES = (
+    "**/play** `[query]` - Plays a song immediately or starts playback if idle",
+    "**/queue** `[query]` - Adds a song to the queue (omit query to view queue)",
+    "**/pause** - Pauses the currently playing track",
+    "**/unpause** - Resumes paused playback",
+    "**/skip** - Skips the currently playing track",
+    "**/jump** `[song_index]` - Jumps to a specific position in the queue",
+    "**/shuffle** - Randomizes the order of the remaining queue",
+    "**/quit** - Stops playback, clears the queue, and disconnects",
+    "**/help** - Displays this help message",
+)
+_EMBED_HELP = info_embed("JazzBot Commands", "\n".join(_HELP_LINES)).set_footer(
+    text="Use /queue without parameters to view the current queue"
+)
+
+
+CommandCallback = TypeVar(
+    "CommandCallback", bound=Callable[..., Awaitable[None]]
+)
+
+
+def defer_interaction(func: CommandCallback) -> CommandCallback:
+    """
+    Defer the interaction before running a slash command handler.
+
+    Handlers that talk to Lavalink or the voice gateway can exceed Discord's
+    3-second response window, so they are acknowledged up front and must
+    reply through interaction.followup.
+    """
+
+    @wraps(func)
+    async def wrapper(
+        self: "MusicCommands", interaction: discord.Interaction, *args: Any, **kwargs: Any
+    ) -> None:
+        await interaction.response.defer(thinking=True)
+        await func(self, interaction, *args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def _normalize_query(query: str) -> str:
+    """Strip whitespace and the <...> wrapper users add to suppress link previews."""
+    query = query.strip()
+    if query.startswith("<") and query.endswith(">"):
+        query = query[1:-1].strip()
+    return query
+
+
+@lru_cache(maxsize=1024)
+def _classify_uri(uri: str) -> TrackSource:
+    """Classify a query or track URI by source, memoized per string."""
+    return "Spotify" if SpotifyResolver.is_spotify_url(uri) else "YouTube"
+
+
+def _is_spotify_playlist(query: str) -> bool:
+    """Check if the query is a Spotify playlist URL."""
+    spotify_id = SpotifyResolver.extract_spotify_id(query.strip())
+    return spotify_id is not None and spotify_id[0] == "playlist"
+
 
 class QueuePaginationView(View):
     """View for paginating through the queue."""
@@ -33,19 +133,39 @@ class QueuePaginationView(View):
         self.guild_id = guild_id
         self.current_page = 0
         self.items_per_page = 10
+        self.total_pages = 1
+        self._lines: List[str] = []  # Formatted queue lines, reused across pages
+        self._lines_version = -1  # Queue version the lines were built from
+
+    def refresh(self) -> None:
+        """Rebuild the formatted lines and page count if the queue has changed."""
+        if self._lines_version == self.queue.version:
+            return
+
+        self._lines = self.cog.format_queue_lines(self.queue)
+        self._lines_version = self.queue.version
+        total_items = len(self._lines)
+        self.total_pages = (total_items + self.items_per_page - 1) // self.items_per_page if total_items > 0 else 1
+        self.current_page = min(self.current_page, self.total_pages - 1)
+
+    def build_embed(self) -> discord.Embed:
+        """Build the embed for the current page."""
+        self.refresh()
+        return self.cog.create_queue_embed(
+            self.queue, self.current_page, self.items_per_page, self._lines
+        )
 
     def update_buttons(self) -> None:
         """Update button states based on current page."""
-        total_items = len(self.queue.queue)
-        total_pages = (total_items + self.items_per_page - 1) // self.items_per_page if total_items > 0 else 1
+        self.refresh()
 
         # Enable/disable buttons based on page position
         self.previous_button.disabled = self.current_page == 0
-        self.next_button.disabled = self.current_page >= total_pages - 1
+        self.next_button.disabled = self.current_page >= self.total_pages - 1
 
     async def update_message(self, interaction: discord.Interaction) -> None:
         """Update the message with current page."""
-        embed = self.cog.create_queue_embed(self.queue, self.current_page, self.items_per_page)
+        embed = self.build_embed()
         self.update_buttons()
         await interaction.response.edit_message(embed=embed, view=self)
 
@@ -59,9 +179,8 @@ class QueuePaginationView(View):
     @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
     async def next_button(self, interaction: discord.Interaction, button: Button) -> None:
         """Go to next page."""
-        total_items = len(self.queue.queue)
-        total_pages = (total_items + self.items_per_page - 1) // self.items_per_page if total_items > 0 else 1
-        if self.current_page < total_pages - 1:
+        self.refresh()
+        if self.current_page < self.total_pages - 1:
             self.current_page += 1
             await self.update_message(interaction)
 
@@ -77,17 +196,58 @@ class MusicCommands(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the music commands cog."""
         self.bot = bot
-        self.queues: dict[int, MusicQueue] = {}  # guild_id -> queue
-        self.empty_channel_tasks: dict[int, asyncio.Task] = {}  # guild_id -> task
+        self.queues: defaultdict[int, MusicQueue] = defaultdict(MusicQueue)  # guild_id -> queue
+        self._empty_deadlines: dict[int, float] = {}  # guild_id -> monotonic disconnect time
         self.notification_channels: dict[int, discord.TextChannel] = {}  # guild_id -> textual channel
-        self.spotify_resolver = SpotifyResolver(
-            Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_CLIENT_SECRET
-        )
+        self._non_bot_counts: dict[int, tuple[int, int]] = {}  # guild_id -> (channel_id, non-bot members)
+        self._bot_channels: dict[int, int] = {}  # guild_id -> voice channel the bot is in
+        self._search_cache: OrderedDict[str, tuple[float, wavelink.Playable]] = OrderedDict()  # query -> (expiry, track)
+        self._search_sem = asyncio.Semaphore(Config.MAX_CONCURRENT_SEARCHES)
+        self._inflight_searches: dict[str, asyncio.Task] = {}  # query -> pending search
+        self._spotify_resolver: Optional[SpotifyResolver] = None
+        self._spotify_native: Optional[bool] = None  # Lavalink resolves Spotify links itself
+        self._guild_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)  # guild_id -> playback lock
+
+    async def cog_load(self) -> None:
+        """Start background tasks when the cog is loaded."""
+        self._reap_empty_channels.start()
+
+    async def cog_unload(self) -> None:
+        """Stop background tasks and release resources when the cog is unloaded."""
+        self._reap_empty_channels.cancel()
+        if self._spotify_resolver is not None:
+            await asyncio.to_thread(self._spotify_resolver.close)
+
+    @property
+    def spotify_resolver(self) -> SpotifyResolver:
+        """Get the Spotify resolver, creating it on first use."""
+        if self._spotify_resolver is None:
+            self._spotify_resolver = SpotifyResolver(
+                Config.SPOTIFY_CLIENT_ID,
+                Config.SPOTIFY_CLIENT_SECRET,
+                Config.SPOTIFY_CACHE_PATH,
+            )
+        return self._spotify_resolver
+
+    async def _lavalink_has_spotify(self) -> bool:
+        """
+        Check whether Lavalink can load Spotify links directly (e.g. via LavaSrc).
+
+        The answer is cached until a node (re)connects.
+
+        Returns:
+            True if the node lists a Spotify source manager
+        """
+        if self._spotify_native is None:
+            try:
+                info = await wavelink.Pool.get_node().fetch_info()
+            except Exception:
+                return False  # Ask again once a node is reachable
+            self._spotify_native = "spotify" in info.source_managers
+        return self._spotify_native
 
     def get_queue(self, guild_id: int) -> MusicQueue:
         """Get or create a queue for a guild."""
-        if guild_id not in self.queues:
-            self.queues[guild_id] = MusicQueue()
         return self.queues[guild_id]
 
     def format_duration(self, seconds: int) -> str:
@@ -100,8 +260,39 @@ class MusicCommands(commands.Cog):
             return f"{hours}:{minutes:02d}:{secs:02d}"
         return f"{minutes}:{secs:02d}"
 
+    def format_queue_lines(
+        self, queue: MusicQueue, start: int = 0, end: Optional[int] = None
+    ) -> List[str]:
+        """
+        Format queue entries as display lines for the queue embed.
+
+        Args:
+            queue: The music queue
+            start: Index of the first entry to format
+            end: Index after the last entry to format (defaults to the end)
+
+        Returns:
+            One formatted line per entry, numbered by queue position
+        """
+        lines = []
+        for idx, entry in enumerate(queue.queue[start:end], start=start + 1):
+            duration_str = self.format_duration(entry.duration)
+            requester_name = entry.requester.display_name if entry.requester else "Unknown"
+
+            # Mark current track
+            marker = "▶️" if idx - 1 == queue.current_index else f"{idx}."
+            lines.append(
+                f"{marker} **{entry.title}**\n"
+                f"   └ Duration: {duration_str} | Source: {entry.source} | Requested by: {requester_name}"
+            )
+        return lines
+
     def create_queue_embed(
-        self, queue: MusicQueue, page: int = 0, items_per_page: int = 10
+        self,
+        queue: MusicQueue,
+        page: int = 0,
+        items_per_page: int = 10,
+        lines: Optional[List[str]] = None,
     ) -> discord.Embed:
         """
         Create an embed displaying the queue with pagination.
@@ -110,6 +301,7 @@ class MusicCommands(commands.Cog):
             queue: The music queue
             page: Current page number (0-based)
             items_per_page: Number of items per page
+            lines: Pre-formatted lines for the whole queue, if already built
 
         Returns:
             Discord embed with queue information
@@ -118,27 +310,17 @@ class MusicCommands(commands.Cog):
         total_pages = (total_items + items_per_page - 1) // items_per_page if total_items > 0 else 1
 
         if total_items == 0:
-            return info_embed("Queue", "The queue is empty.")
+            return _EMBED_EMPTY_QUEUE_INFO
 
         # Calculate pagination
         start_idx = page * items_per_page
         end_idx = min(start_idx + items_per_page, total_items)
-        page_items = queue.queue[start_idx:end_idx]
-
-        # Build description
-        description_parts = []
-        for idx, entry in enumerate(page_items, start=start_idx + 1):
-            duration_str = self.format_duration(entry.duration)
-            requester_name = entry.requester.display_name if entry.requester else "Unknown"
-            
-            # Mark current track
-            marker = "▶️" if idx - 1 == queue.current_index else f"{idx}."
-            description_parts.append(
-                f"{marker} **{entry.title}**\n"
-                f"   └ Duration: {duration_str} | Source: {entry.source} | Requested by: {requester_name}"
-            )
+        if lines is not None:
+            page_lines = lines[start_idx:end_idx]
+        else:
+            page_lines = self.format_queue_lines(queue, start_idx, end_idx)
 
-        description = "\n\n".join(description_parts)
+        description = "\n\n".join(page_lines)
         
         embed = info_embed(
             "Music Queue",
@@ -148,50 +330,142 @@ class MusicCommands(commands.Cog):
 
         return embed
 
-    async def search_track(self, query: str) -> Optional[wavelink.Playable]:
+    async def _play_entry(self, player: wavelink.Player, entry: QueueEntry) -> bool:
+        """
+        Play a queue entry, fetching its track only if none is stored.
+
+        Args:
+            player: The guild's Wavelink player
+            entry: The queue entry to play
+
+        Returns:
+            True if playback started, False if the track could not be loaded
+        """
+        track = entry.track
+        if track is None:
+            results = await wavelink.Pool.fetch_tracks(entry.identifier)
+            if not results:
+                return False
+            track = results[0]
+
+        await player.play(track)
+        return True
+
+    async def search_track(
+        self, query: str, cache: bool = True
+    ) -> Tuple[Optional[wavelink.Playable], TrackSource]:
+        """
+        Search for a track, reusing recent results for repeated queries.
+
+        Args:
+            query: Search query or URL
+            cache: Whether to store the result and refresh its cache entry;
+                bulk imports pass False so they do not evict interactive queries
+
+        Returns:
+            Tuple of (track, source), where track is None if nothing was found
+            and source labels where the query came from
+        """
+        source = _classify_uri(query)
+
+        # URLs keep their case since video IDs are case-sensitive
+        key = query.strip()
+        if not key.startswith(("http://", "https://")):
+            key = key.casefold()
+
+        cached = self._search_cache.get(key)
+        if cached:
+            expiry, track = cached
+            if expiry > time.monotonic():
+                if cache:
+                    self._search_cache.move_to_end(key)
+                return track, source
+            del self._search_cache[key]
+
+        # Share one search between concurrent requests for the same query
+        task = self._inflight_searches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_track(query, source))
+            self._inflight_searches[key] = task
+            task.add_done_callback(lambda _: self._inflight_searches.pop(key, None))
+
+        # Shielded so one cancelled caller does not cancel the others' search
+        track = await asyncio.shield(task)
+        if track and cache:
+            self._search_cache[key] = (time.monotonic() + _SEARCH_CACHE_TTL, track)
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return track, source
+
+    async def search_tracks_batch(
+        self, queries: List[str]
+    ) -> List[Optional[wavelink.Playable]]:
+        """
+        Search for several tracks concurrently.
+
+        At most _PLAYLIST_SEARCH_CONCURRENCY of them wait on the shared search
+        semaphore at once, so other guilds' searches are not queued behind
+        the whole batch. Results are not added to the search cache, which is
+        kept for interactive queries.
+
+        Args:
+            queries: Search queries or URLs
+
+        Returns:
+            One track (or None if not found) per query, in the same order
+        """
+        batch_sem = asyncio.Semaphore(_PLAYLIST_SEARCH_CONCURRENCY)
+
+        async def search(query: str) -> Tuple[Optional[wavelink.Playable], TrackSource]:
+            async with batch_sem:
+                return await self.search_track(query, cache=False)
+
+        results = await asyncio.gather(
+            *(search(query) for query in queries),
+            return_exceptions=True,
+        )
+        return [
+            None if isinstance(result, BaseException) else result[0]
+            for result in results
+        ]
+
+    async def _fetch_track(
+        self, query: str, source: TrackSource
+    ) -> Optional[wavelink.Playable]:
         """
         Search for a track using Wavelink.
 
         Args:
             query: Search query or URL
+            source: Source of the query, as classified by search_track
 
         Returns:
             Wavelink Playable object or None
         """
-        logger = logging.getLogger(__name__)
-        
         try:
-            # Check if it's a Spotify URL
-            if self.spotify_resolver.is_spotify_url(query):
-                # Resolve Spotify to searchable query
-                resolved = self.spotify_resolver.resolve_track(query)
+            # Check if any nodes are available before paying for Spotify
+            if not wavelink.Pool.nodes:
+                logger.error("No Lavalink nodes available for search")
+                return None
+
+            # Resolve Spotify links to a search query unless Lavalink can
+            # load them itself
+            if source == "Spotify" and not await self._lavalink_has_spotify():
+                # Resolve Spotify to searchable query; spotipy blocks, so
+                # keep it off the event loop
+                resolved = await asyncio.to_thread(
+                    self.spotify_resolver.resolve_track, query
+                )
                 if resolved:
                     query = resolved
-                # If playlist, handle differently
-                if "playlist" in query.lower():
-                    # For now, just use the first track
-                    # Full playlist support can be added later
-                    pass
-
-            # Check if query is already a URL (YouTube, etc.)
-            is_url = (
-                query.startswith("http://")
-                or query.startswith("https://")
-                or query.startswith("ytsearch:")
-                or query.startswith("scsearch:")
-            )
 
-            # If not a URL, add ytsearch: prefix for YouTube search
-            if not is_url:
+            # If not a URL or search prefix, search YouTube
+            if not query.startswith(_URL_PREFIXES):
                 query = f"ytsearch:{query}"
 
-            # Check if any nodes are available
-            if not wavelink.Pool.nodes:
-                logger.error("No Lavalink nodes available for search")
-                return None
-
             # Search using Wavelink
-            tracks = await wavelink.Pool.fetch_tracks(query)
+            async with self._search_sem:
+                tracks = await wavelink.Pool.fetch_tracks(query)
             if not tracks:
                 logger.warning(f"No tracks found for query: {query}")
                 return None
@@ -212,6 +486,7 @@ class MusicCommands(commands.Cog):
         interaction: discord.Interaction,
         track: wavelink.Playable,
         requester: discord.Member,
+        source: TrackSource,
     ) -> None:
         """
         Play a track in the voice channel.
@@ -220,113 +495,238 @@ class MusicCommands(commands.Cog):
             interaction: Discord interaction
             track: Wavelink playable track
             requester: User who requested the track
+            source: Source the track was requested from
         """
-        voice_client: Optional[wavelink.Player] = interaction.guild.voice_client  # type: ignore
+        guild: discord.Guild = interaction.guild  # type: ignore
+        voice_client: Optional[wavelink.Player] = guild.voice_client  # type: ignore
 
         if not voice_client:
             return
 
-        queue = self.get_queue(interaction.guild_id)  # type: ignore
+        queue = self.get_queue(guild.id)
 
         # Create queue entry
-        source = (
-            "Spotify"
-            if self.spotify_resolver.is_spotify_url(str(track.uri or ""))
-            else "YouTube"
-        )
         entry = QueueEntry(
             title=track.title or "Unknown",
             source=source,
-            duration=int(track.length / 1000),  # Convert ms to seconds
+            duration=track.length // 1000,  # Convert ms to seconds
             requester=requester,
             identifier=str(track.uri) if track.uri else "",
             uri=str(track.uri) if track.uri else None,
+            track=track,
         )
 
-        # If not playing, start immediately
-        if not queue.is_playing:
+        async with self._guild_locks[guild.id]:
             queue.add(entry)
-            await voice_client.play(track)
-            queue.set_playing(True)
-
-            embed = success_embed(
-                "Now Playing",
-                f"**{track.title}**\n"
-                f"Duration: {self.format_duration(entry.duration)}\n"
-                f"Requested by: {requester.mention}",
-            )
-        else:
-            # Add to queue
-            queue.add(entry)
-            embed = success_embed(
-                "Added to Queue",
-                f"**{track.title}**\n"
-                f"Duration: {self.format_duration(entry.duration)}\n"
-                f"Position in queue: {len(queue.queue)}",
-            )
 
-        # Use followup if response is already deferred, otherwise use response
-        if interaction.response.is_done():
-            await interaction.followup.send(embed=embed)
-        else:
-            await interaction.response.send_message(embed=embed)
+            # If not playing, start immediately from the new entry
+            if not queue.is_playing:
+                queue.jump(len(queue.queue) - 1)
+                await voice_client.play(track)
+                queue.set_playing(True)
 
-    async def _play_track_search_and_play(self, interaction: discord.Interaction, query: str) -> None:
+                embed = success_embed(
+                    "Now Playing",
+                    f"**{track.title}**\n"
+                    f"Duration: {self.format_duration(entry.duration)}\n"
+                    f"Requested by: {requester.mention}",
+                )
+            else:
+                embed = success_embed(
+                    "Added to Queue",
+                    f"**{track.title}**\n"
+                    f"Duration: {self.format_duration(entry.duration)}\n"
+                    f"Position in queue: {len(queue.queue)}",
+                )
+
+        await interaction.followup.send(embed=embed)
+
+    async def _prepare(
+        self, interaction: discord.Interaction
+    ) -> Tuple[Optional[wavelink.Player], Optional[discord.Embed]]:
         """
-        Helper method to validate voice state, connect, search, and play a track.
-        Used by both /play and /queue commands.
+        Validate the voice context for a playback command and connect if needed.
+
+        Args:
+            interaction: The Discord interaction
+
+        Returns:
+            Tuple of (voice_client, error_embed)
+            If valid, error_embed will be None
+            If invalid, voice_client will be None
         """
+        guild: discord.Guild = interaction.guild  # type: ignore
+
         # Validate voice context
         is_valid, error_emb, voice_channel = await validate_voice_context(
             interaction
         )
         if not is_valid:
-            await interaction.response.send_message(embed=error_emb)
-            return
+            return None, error_emb
 
         # Store notification channel
         if isinstance(interaction.channel, discord.TextChannel):
-            self.notification_channels[interaction.guild_id] = interaction.channel  # type: ignore
+            self.notification_channels[guild.id] = interaction.channel
 
         # Ensure bot voice state
-        bot_voice_client = interaction.guild.voice_client  # type: ignore
+        voice_client: Optional[wavelink.Player] = guild.voice_client  # type: ignore
         is_valid, error_emb = await ensure_bot_voice_state(
-            interaction, voice_channel, bot_voice_client
+            interaction, voice_channel, voice_client  # type: ignore
         )
         if not is_valid:
-            await interaction.response.send_message(embed=error_emb)
-            return
+            return None, error_emb
 
         # Connect bot if not connected
-        if bot_voice_client is None:
+        if voice_client is None:
             try:
-                player: wavelink.Player = await voice_channel.connect(cls=wavelink.Player)  # type: ignore
-                player.inactive_timeout = 600  # 10 minutes
-                bot_voice_client = player
+                voice_client = await self._connect_player(voice_channel)  # type: ignore
             except Exception:
-                await interaction.response.send_message(
-                    embed=error_embed(
-                        "Connection Failed", "Failed to connect to voice channel."
-                    )
+                return None, error_embed(
+                    "Connection Failed", "Failed to connect to voice channel."
+                )
+            if voice_client is None:
+                return None, error_embed(
+                    "Connection Timed Out",
+                    "Connecting to your voice channel took too long. Please try again.",
                 )
-                return
 
-        # Defer response while searching
-        await interaction.response.defer()
+        return voice_client, None
 
-        # Search for track
-        track = await self.search_track(query)
-        if not track:
+    async def _connect_player(
+        self, voice_channel: discord.VoiceChannel
+    ) -> Optional[wavelink.Player]:
+        """
+        Connect a Wavelink player to a voice channel, retrying on timeouts.
+
+        Args:
+            voice_channel: The voice channel to join
+
+        Returns:
+            The connected player, or None if every attempt timed out
+        """
+        for attempt in range(_VOICE_CONNECT_ATTEMPTS):
+            try:
+                player: wavelink.Player = await voice_channel.connect(
+                    cls=wavelink.Player, timeout=_VOICE_CONNECT_TIMEOUT  # type: ignore
+                )
+                player.inactive_timeout = 600  # 10 minutes
+                return player
+            except (asyncio.TimeoutError, wavelink.ChannelTimeoutException):
+                # A timed-out player stays registered on the guild; drop it
+                # so the next attempt can connect
+                stale = voice_channel.guild.voice_client
+                if stale:
+                    try:
+                        await stale.disconnect(force=True)
+                    except Exception as e:
+                        logger.warning(f"Failed to clean up timed-out voice connection: {e}")
+                await asyncio.sleep(_VOICE_CONNECT_BACKOFF * 2**attempt)
+
+        return None
+
+    async def queue_spotify_playlist(
+        self,
+        interaction: discord.Interaction,
+        voice_client: wavelink.Player,
+        url: str,
+    ) -> None:
+        """
+        Queue a Spotify playlist (up to _MAX_PLAYLIST_TRACKS tracks), starting playback if idle.
+
+        Args:
+            interaction: Discord interaction (already deferred)
+            voice_client: The guild's connected player
+            url: Spotify playlist URL
+        """
+        queue = self.get_queue(interaction.guild_id)  # type: ignore
+
+        if await self._lavalink_has_spotify():
+            # Lavalink loads the whole playlist in a single request
+            try:
+                async with self._search_sem:
+                    results = await wavelink.Pool.fetch_tracks(url)
+            except Exception as e:
+                logger.error(f"Error loading Spotify playlist '{url}': {e}", exc_info=True)
+                results = []
+            tracks = list(results)
+            truncated = len(tracks) > _MAX_PLAYLIST_TRACKS
+            tracks = tracks[:_MAX_PLAYLIST_TRACKS]
+            requested = len(tracks)
+        else:
+            queries = await asyncio.to_thread(
+                self.spotify_resolver.resolve_playlist, url, _MAX_PLAYLIST_TRACKS
+            )
+            truncated = len(queries) > _MAX_PLAYLIST_TRACKS
+            queries = queries[:_MAX_PLAYLIST_TRACKS]
+            tracks = [track for track in await self.search_tracks_batch(queries) if track]
+            requested = len(queries)
+
+        if not tracks:
             await interaction.followup.send(
-                embed=error_embed("Track Not Found", "Could not find the requested track.")
+                embed=error_embed(
+                    "Playlist Not Found", "Could not load any tracks from that playlist."
+                )
             )
             return
 
+        first_index = len(queue.queue)
+        for track in tracks:
+            queue.add(
+                QueueEntry(
+                    title=track.title or "Unknown",
+                    source="Spotify",
+                    duration=track.length // 1000,
+                    requester=interaction.user,  # type: ignore
+                    identifier=str(track.uri) if track.uri else "",
+                    uri=str(track.uri) if track.uri else None,
+                    track=track,
+                )
+            )
+
+        description = f"Added **{len(tracks)}** track(s) to the queue."
+        if len(tracks) < requested:
+            description += f"\n{requested - len(tracks)} track(s) could not be found."
+        if truncated:
+            description += f"\nOnly the first {_MAX_PLAYLIST_TRACKS} tracks of the playlist were imported."
+
+        # Start from the first new track if nothing is playing
+        async with self._guild_locks[interaction.guild_id]:  # type: ignore
+            if not queue.is_playing:
+                entry = queue.jump(first_index)
+                if entry and await self._play_entry(voice_client, entry):
+                    queue.set_playing(True)
+                    description += f"\nNow playing: **{entry.title}**"
+
+        await interaction.followup.send(embed=success_embed("Playlist Queued", description))
+
+    async def _play_track_search_and_play(self, interaction: discord.Interaction, query: str) -> None:
+        """
+        Helper method to validate voice state, connect, search, and play a track.
+        Used by both /play and /queue commands.
+        """
+        query = _normalize_query(query)
+
+        voice_client, error_emb = await self._prepare(interaction)
+        if error_emb:
+            await interaction.followup.send(embed=error_emb)
+            return
+
+        if _is_spotify_playlist(query):
+            await self.queue_spotify_playlist(interaction, voice_client, query)  # type: ignore
+            return
+
+        # Search for track
+        track, source = await self.search_track(query)
+        if not track:
+            await interaction.followup.send(embed=_EMBED_TRACK_NOT_FOUND)
+            return
+
         # Play track
-        await self.play_track(interaction, track, interaction.user)  # type: ignore
+        await self.play_track(interaction, track, interaction.user, source)  # type: ignore
 
     @app_commands.command(name="play", description="Plays a song immediately or starts playback if idle")
     @app_commands.describe(query="Song name, YouTube URL, or Spotify URL")
+    @defer_interaction
     async def play_command(
         self, interaction: discord.Interaction, query: str
     ) -> None:
@@ -335,170 +735,102 @@ class MusicCommands(commands.Cog):
 
     @app_commands.command(name="queue", description="Adds a song to the queue or displays the current queue")
     @app_commands.describe(query="Song name, YouTube URL, or Spotify URL (optional - omit to view queue)")
+    @defer_interaction
     async def queue_command(
         self, interaction: discord.Interaction, query: Optional[str] = None
     ) -> None:
         """
-        Add a song to the queue (or play if queue is empty).
+        Add a song to the queue (or play if nothing is playing).
         If no query is provided, display the current queue with pagination.
         """
-        queue = self.get_queue(interaction.guild_id)  # type: ignore
+        guild_id: int = interaction.guild_id  # type: ignore
+        queue = self.get_queue(guild_id)
 
         # If no query provided, display the queue
         if query is None:
             if queue.is_empty:
-                await interaction.response.send_message(
-                    embed=info_embed("Queue", "The queue is empty.")
-                )
+                await interaction.followup.send(embed=_EMBED_EMPTY_QUEUE_INFO)
                 return
 
             # Create pagination view
-            view = QueuePaginationView(self, queue, interaction.guild_id)  # type: ignore
-            embed = self.create_queue_embed(queue, 0, 10)
+            view = QueuePaginationView(self, queue, guild_id)
+            embed = view.build_embed()
             view.update_buttons()
-            await interaction.response.send_message(embed=embed, view=view)
+            await interaction.followup.send(embed=embed, view=view)
             return
 
-        # If query is provided, add song to queue (existing behavior)
-        # Special case: if queue is empty, behave like /play
-        if queue.is_empty:
-            await self._play_track_search_and_play(interaction, query)
-            return
-
-        # Validate voice context
-        is_valid, error_emb, voice_channel = await validate_voice_context(
-            interaction
-        )
-        if not is_valid:
-            await interaction.response.send_message(embed=error_emb)
-            return
-
-        # Ensure bot voice state
-        bot_voice_client = interaction.guild.voice_client  # type: ignore
-        is_valid, error_emb = await ensure_bot_voice_state(
-            interaction, voice_channel, bot_voice_client
-        )
-        if not is_valid:
-            await interaction.response.send_message(embed=error_emb)
-            return
-
-        # Defer response while searching
-        await interaction.response.defer()
-
-        # Search for track
-        track = await self.search_track(query)
-        if not track:
-            await interaction.followup.send(
-                embed=error_embed(
-                    "Track Not Found", "Could not find the requested track."
-                )
-            )
-            return
-
-        # Add to queue
-        source = (
-            "Spotify"
-            if self.spotify_resolver.is_spotify_url(str(track.uri or ""))
-            else "YouTube"
-        )
-        entry = QueueEntry(
-            title=track.title or "Unknown",
-            source=source,
-            duration=int(track.length / 1000),
-            requester=interaction.user,  # type: ignore
-            identifier=str(track.uri) if track.uri else "",
-            uri=str(track.uri) if track.uri else None,
-        )
-
-        queue.add(entry)
-
-        embed = success_embed(
-            "Added to Queue",
-            f"**{track.title}**\n"
-            f"Duration: {self.format_duration(entry.duration)}\n"
-            f"Position in queue: {len(queue.queue)}",
-        )
-        await interaction.followup.send(embed=embed)
+        # Adding plays immediately when idle and queues otherwise, as /play does
+        await self._play_track_search_and_play(interaction, query)
 
     @app_commands.command(name="pause", description="Pauses the currently playing track")
+    @defer_interaction
     async def pause_command(self, interaction: discord.Interaction) -> None:
         """Pause the currently playing track."""
         voice_client: Optional[wavelink.Player] = interaction.guild.voice_client  # type: ignore
 
         if not voice_client or not voice_client.playing:
-            await interaction.response.send_message(
-                embed=error_embed("Not Playing", "No track is currently playing.")
-            )
+            await interaction.followup.send(embed=_EMBED_NOT_PLAYING)
             return
 
         if voice_client.paused:
-            await interaction.response.send_message(
-                embed=error_embed("Already Paused", "Playback is already paused.")
-            )
+            await interaction.followup.send(embed=_EMBED_ALREADY_PAUSED)
             return
 
         await voice_client.pause(True)
         queue = self.get_queue(interaction.guild_id)  # type: ignore
         queue.set_paused(True)
 
-        await interaction.response.send_message(
-            embed=success_embed("Paused", "Playback has been paused.")
-        )
+        await interaction.followup.send(embed=_EMBED_PAUSED)
 
     @app_commands.command(name="unpause", description="Resumes paused playback")
+    @defer_interaction
     async def unpause_command(self, interaction: discord.Interaction) -> None:
         """Resume paused playback."""
         voice_client: Optional[wavelink.Player] = interaction.guild.voice_client  # type: ignore
 
         if not voice_client or not voice_client.paused:
-            await interaction.response.send_message(
-                embed=error_embed("Not Paused", "Playback is not paused.")
-            )
+            await interaction.followup.send(embed=_EMBED_NOT_PAUSED)
             return
 
         await voice_client.pause(False)
         queue = self.get_queue(interaction.guild_id)  # type: ignore
         queue.set_paused(False)
 
-        await interaction.response.send_message(
-            embed=success_embed("Resumed", "Playback has been resumed.")
-        )
+        await interaction.followup.send(embed=_EMBED_RESUMED)
 
     @app_commands.command(name="skip", description="Skips the currently playing track")
+    @defer_interaction
     async def skip_command(self, interaction: discord.Interaction) -> None:
         """Skip the currently playing track."""
         voice_client: Optional[wavelink.Player] = interaction.guild.voice_client  # type: ignore
         queue = self.get_queue(interaction.guild_id)  # type: ignore
 
         if not voice_client or not voice_client.playing:
-            await interaction.response.send_message(
-                embed=error_embed("Not Playing", "No track is currently playing.")
-            )
+            await interaction.followup.send(embed=_EMBED_NOT_PLAYING)
             return
 
         # Skip to next track
-        next_track = queue.skip()
-        if next_track:
-            # Find and play next track
-            track = await wavelink.Pool.fetch_tracks(next_track.identifier)
-            if track:
-                await voice_client.play(track[0])
-                embed = success_embed(
-                    "Skipped",
-                    f"Now playing: **{next_track.title}**",
-                )
+        async with self._guild_locks[interaction.guild_id]:  # type: ignore
+            next_track = queue.skip()
+            if next_track:
+                if await self._play_entry(voice_client, next_track):
+                    embed = success_embed(
+                        "Skipped",
+                        f"Now playing: **{next_track.title}**",
+                    )
+                else:
+                    embed = error_embed("Skip Failed", "Could not load the next track.")
             else:
-                embed = error_embed("Skip Failed", "Could not load the next track.")
-        else:
-            # No more tracks
-            await voice_client.stop()
-            queue.set_playing(False)
-            embed = success_embed("Skipped", "Reached the end of the queue.")
+                # No more tracks
+                await voice_client.stop()
+                queue.set_playing(False)
+                embed = success_embed("Skipped", "Reached the end of the queue.")
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="jump", description="Jumps to a specific position in the queue")
     @app_commands.describe(song_index="The position in the queue (1-based)")
+    @defer_interaction
     async def jump_command(
         self, interaction: discord.Interaction, song_index: int
     ) -> None:
@@ -507,40 +839,37 @@ class MusicCommands(commands.Cog):
         voice_client: Optional[wavelink.Player] = interaction.guild.voice_client  # type: ignore
 
         if queue.is_empty:
-            await interaction.response.send_message(
-                embed=error_embed("Empty Queue", "The queue is empty.")
-            )
+            await interaction.followup.send(embed=_EMBED_EMPTY_QUEUE)
             return
 
         # Convert to 0-based index
         index = song_index - 1
-        if index < 0 or index >= len(queue.queue):
-            await interaction.response.send_message(
+        queue_length = len(queue.queue)
+        if index < 0 or index >= queue_length:
+            await interaction.followup.send(
                 embed=error_embed(
                     "Invalid Index",
-                    f"Please provide a number between 1 and {len(queue.queue)}.",
+                    f"Please provide a number between 1 and {queue_length}.",
                 )
             )
             return
 
         # Jump to track
-        track_entry = queue.jump(index)
-        if track_entry and voice_client:
-            # Load and play the track
-            track = await wavelink.Pool.fetch_tracks(track_entry.identifier)
-            if track:
-                await voice_client.play(track[0])
-                queue.set_playing(True)
-                embed = success_embed(
-                    "Jumped",
-                    f"Now playing: **{track_entry.title}** (Position {song_index})",
-                )
+        async with self._guild_locks[interaction.guild_id]:  # type: ignore
+            track_entry = queue.jump(index)
+            if track_entry and voice_client:
+                if await self._play_entry(voice_client, track_entry):
+                    queue.set_playing(True)
+                    embed = success_embed(
+                        "Jumped",
+                        f"Now playing: **{track_entry.title}** (Position {song_index})",
+                    )
+                else:
+                    embed = error_embed("Jump Failed", "Could not load the requested track.")
             else:
-                embed = error_embed("Jump Failed", "Could not load the requested track.")
-        else:
-            embed = error_embed("Jump Failed", "Could not jump to that position.")
+                embed = error_embed("Jump Failed", "Could not jump to that position.")
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="shuffle", description="Randomizes the order of the remaining queue")
     async def shuffle_command(self, interaction: discord.Interaction) -> None:
@@ -548,53 +877,40 @@ class MusicCommands(commands.Cog):
         queue = self.get_queue(interaction.guild_id)  # type: ignore
 
         if len(queue.queue) <= 1:
-            await interaction.response.send_message(
-                embed=warning_embed("Cannot Shuffle", "Need at least 2 tracks to shuffle.")
-            )
+            await interaction.response.send_message(embed=_EMBED_CANNOT_SHUFFLE)
             return
 
         queue.shuffle()
-        await interaction.response.send_message(
-            embed=success_embed("Shuffled", "The queue has been shuffled.")
-        )
+        await interaction.response.send_message(embed=_EMBED_SHUFFLED)
 
     @app_commands.command(name="quit", description="Stops playback, clears the queue, and disconnects")
+    @defer_interaction
     async def quit_command(self, interaction: discord.Interaction) -> None:
         """Stop playback, clear queue, and disconnect from voice channel."""
-        voice_client: Optional[wavelink.Player] = interaction.guild.voice_client  # type: ignore
-        queue = self.get_queue(interaction.guild_id)  # type: ignore
+        guild: discord.Guild = interaction.guild  # type: ignore
+        voice_client: Optional[wavelink.Player] = guild.voice_client  # type: ignore
+        guild_id = guild.id
 
         if voice_client:
             await voice_client.disconnect()
 
-        del self.queues[interaction.guild_id]  # type: ignore
-        if interaction.guild_id in self.notification_channels:
-            del self.notification_channels[interaction.guild_id]  # type: ignore
+        self.queues.pop(guild_id, None)
+        self.notification_channels.pop(guild_id, None)
+        self._empty_deadlines.pop(guild_id, None)
 
-        await interaction.response.send_message(
-            embed=success_embed("Disconnected", "Left the voice channel and cleared the queue.")
-        )
+        await interaction.followup.send(embed=_EMBED_DISCONNECTED)
 
     @app_commands.command(name="help", description="Displays all available commands")
     async def help_command(self, interaction: discord.Interaction) -> None:
         """Display all available commands."""
-        commands_list = [
-            "**/play** `[query]` - Plays a song immediately or starts playback if idle",
-            "**/queue** `[query]` - Adds a song to the queue (omit query to view queue)",
-            "**/pause** - Pauses the currently playing track",
-            "**/unpause** - Resumes paused playback",
-            "**/skip** - Skips the currently playing track",
-            "**/jump** `[song_index]` - Jumps to a specific position in the queue",
-            "**/shuffle** - Randomizes the order of the remaining queue",
-            "**/quit** - Stops playback, clears the queue, and disconnects",
-            "**/help** - Displays this help message",
-        ]
-
-        description = "\n".join(commands_list)
-        embed = info_embed("JazzBot Commands", description)
-        embed.set_footer(text="Use /queue without parameters to view the current queue")
+        await interaction.response.send_message(embed=_EMBED_HELP)
 
-        await interaction.response.send_message(embed=embed)
+    @commands.Cog.listener()
+    async def on_wavelink_node_ready(
+        self, payload: wavelink.NodeReadyEventPayload
+    ) -> None:
+        """Re-check Lavalink's Spotify support after a node (re)connects."""
+        self._spotify_native = None
 
     @commands.Cog.listener()
     async def on_wavelink_track_end(
@@ -604,39 +920,45 @@ class MusicCommands(commands.Cog):
         if not payload.player or not payload.player.guild:
             return
 
+        # Replaced and stopped tracks were ended by /skip, /jump or /play,
+        # which have already moved the queue
+        if payload.reason not in ("finished", "loadFailed"):
+            return
+
         guild_id = payload.player.guild.id
-        queue = self.get_queue(guild_id)
+
+        # Nothing to advance for guilds without a queue; avoid creating one
+        queue = self.queues.get(guild_id)
+        if queue is None or queue.is_empty:
+            return
 
         # Skip to next track
-        next_track = queue.skip()
-        if next_track:
-            # Find and play next track
-            track = await wavelink.Pool.fetch_tracks(next_track.identifier)
-            if track and payload.player:
-                await payload.player.play(track[0])
-                queue.set_playing(True)
-        else:
-            # Queue is empty
-            queue.set_playing(False)
+        async with self._guild_locks[guild_id]:
+            next_track = queue.skip()
+            if next_track:
+                if await self._play_entry(payload.player, next_track):
+                    queue.set_playing(True)
+            else:
+                # Queue is empty
+                queue.set_playing(False)
 
     @commands.Cog.listener()
     async def on_wavelink_inactive_player(self, player: wavelink.Player) -> None:
         """Handle player inactivity by disconnecting."""
         if player.guild:
             # Clear queue
-            if player.guild.id in self.queues:
-                self.queues[player.guild.id].clear()
-            
-            # Cancel any empty channel task
-            if player.guild.id in self.empty_channel_tasks:
-                self.empty_channel_tasks[player.guild.id].cancel()
-                del self.empty_channel_tasks[player.guild.id]
+            queue = self.queues.get(player.guild.id)
+            if queue is not None:
+                queue.clear()
+
+            # Cancel any pending empty channel disconnect
+            self._empty_deadlines.pop(player.guild.id, None)
 
         await player.disconnect()
 
         # Send notification
-        if player.guild and player.guild.id in self.notification_channels:
-            channel = self.notification_channels[player.guild.id]
+        channel = self.notification_channels.pop(player.guild.id, None) if player.guild else None
+        if channel:
             try:
                 await channel.send(
                     embed=info_embed(
@@ -646,8 +968,6 @@ class MusicCommands(commands.Cog):
                 )
             except Exception:
                 pass  # Ignore if cannot send message
-            
-            del self.notification_channels[player.guild.id]
 
     @commands.Cog.listener()
     async def on_voice_state_update(
@@ -657,69 +977,103 @@ class MusicCommands(commands.Cog):
         after: discord.VoiceState,
     ) -> None:
         """Handle voice state updates to disconnect when channel is empty."""
-        bot_id = self.bot.user.id if self.bot.user else None
-        
-        # We only care if the bot is in a voice channel in this guild
-        if not member.guild.voice_client:
+        # Mute, deafen and stream toggles never change channel membership
+        if before.channel == after.channel:
             return
 
-        bot_player: wavelink.Player = member.guild.voice_client  # type: ignore
-        if not bot_player.channel:
+        bot_id = self.bot.user.id if self.bot.user else None
+        guild_id = member.guild.id
+
+        # The bot itself joined, moved or left; track its channel and
+        # recount from scratch next time
+        if member.id == bot_id:
+            self._non_bot_counts.pop(guild_id, None)
+            if after.channel is not None:
+                self._bot_channels[guild_id] = after.channel.id
+            else:
+                self._bot_channels.pop(guild_id, None)
+
+        # We only care if the bot is in a voice channel in this guild
+        channel_id = self._bot_channels.get(guild_id)
+        if channel_id is None:
             return
 
         # Check if the update affects the bot's channel
-        affected = False
-        if before.channel and before.channel.id == bot_player.channel.id:
-            affected = True
-        elif after.channel and after.channel.id == bot_player.channel.id:
-            affected = True
-            
-        if not affected:
-            return
+        left = before.channel is not None and before.channel.id == channel_id
+        joined = after.channel is not None and after.channel.id == channel_id
 
-        # Check member count (excluding bots is optional, but user said "users")
-        # Let's count non-bot members
-        members = bot_player.channel.members
-        non_bot_count = sum(1 for m in members if not m.bot)
+        if not (left or joined):
+            return
 
-        guild_id = member.guild.id
+        # Count non-bot members incrementally; only walk the member list the
+        # first time a channel is seen (the cache already reflects this update)
+        cached = self._non_bot_counts.get(guild_id)
+        if cached is None or cached[0] != channel_id:
+            channel = after.channel if joined else before.channel
+            non_bot_count = sum(1 for m in channel.members if not m.bot)  # type: ignore
+        else:
+            non_bot_count = cached[1]
+            if not member.bot:
+                non_bot_count += 1 if joined else -1
+        self._non_bot_counts[guild_id] = (channel_id, non_bot_count)
 
         if non_bot_count == 0:
             # Schedule disconnect if not already scheduled
-            if guild_id not in self.empty_channel_tasks:
-                async def disconnect_after_timeout() -> None:
-                    await asyncio.sleep(600)  # 10 minutes
-                    if member.guild.voice_client:
-                        await member.guild.voice_client.disconnect()
-                        if guild_id in self.queues:
-                            self.queues[guild_id].clear()
-                        
-                        # Send notification
-                        if guild_id in self.notification_channels:
-                            channel = self.notification_channels[guild_id]
-                            try:
-                                await channel.send(
-                                    embed=info_embed(
-                                        "Disconnected", 
-                                        "I left the voice channel because it was empty."
-                                    )
-                                )
-                            except Exception:
-                                pass
-                            del self.notification_channels[guild_id]
-
-                    if guild_id in self.empty_channel_tasks:
-                        del self.empty_channel_tasks[guild_id]
-
-                self.empty_channel_tasks[guild_id] = self.bot.loop.create_task(
-                    disconnect_after_timeout()
-                )
+            if guild_id not in self._empty_deadlines:
+                self._empty_deadlines[guild_id] = time.monotonic() + _EMPTY_CHANNEL_TIMEOUT
         else:
             # Cancel disconnect if scheduled
-            if guild_id in self.empty_channel_tasks:
-                self.empty_channel_tasks[guild_id].cancel()
-                del self.empty_channel_tasks[guild_id]
+            self._empty_deadlines.pop(guild_id, None)
+
+    @tasks.loop(seconds=_EMPTY_CHANNEL_CHECK_INTERVAL)
+    async def _reap_empty_channels(self) -> None:
+        """Disconnect from voice channels that have stayed empty past their deadline."""
+        if not self._empty_deadlines:
+            return
+
+        now = time.monotonic()
+        expired = [
+            guild_id
+            for guild_id, deadline in self._empty_deadlines.items()
+            if deadline <= now
+        ]
+        for guild_id in expired:
+            # Earlier awaits may have let a rejoin, /quit or the inactivity
+            # handler cancel or move this deadline
+            deadline = self._empty_deadlines.get(guild_id)
+            if deadline is None or deadline > time.monotonic():
+                continue
+            self._empty_deadlines.pop(guild_id, None)
+
+            try:
+                await self._leave_empty_channel(guild_id)
+            except Exception as e:
+                # Keep the reaper alive for other guilds
+                logger.error(f"Failed to leave empty channel in guild {guild_id}: {e}", exc_info=True)
+
+    async def _leave_empty_channel(self, guild_id: int) -> None:
+        """Disconnect from a guild's empty voice channel, clear its queue and notify."""
+        guild = self.bot.get_guild(guild_id)
+        if not guild or not guild.voice_client:
+            return
 
+        await guild.voice_client.disconnect()
+        queue = self.queues.get(guild_id)
+        if queue is not None:
+            queue.clear()
+
+        # Send notification
+        channel = self.notification_channels.pop(guild_id, None)
+        if channel:
+            try:
+                await channel.send(
+                    embed=info_embed(
+                        "Disconnected",
+                        "I left the voice channel because it was empty."
+                    )
+                )
+            except Exception:
+                pass
 
 async def setup(bot: commands.Bot) -> None:
     """Setup function for the cog."""
@@ -8,6 +8,24 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _positive_int_env(name: str, default: int) -> int:
+    """
+    Read a positive integer from the environment.
+
+    Unset or empty values use the default; values below 1 are clamped to 1.
+
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+
+
 class Config:
     """Bot configuration loaded from environment variables."""
 
@@ -22,6 +40,10 @@ class Config:
     # Spotify API (optional, for metadata)
     SPOTIFY_CLIENT_ID: Optional[str] = os.getenv("SPOTIFY_CLIENT_ID")
     SPOTIFY_CLIENT_SECRET: Optional[str] = os.getenv("SPOTIFY_CLIENT_SECRET")
+    SPOTIFY_CACHE_PATH: Optional[str] = os.getenv("SPOTIFY_CACHE_PATH")
+
+    # Maximum number of Lavalink searches in flight at once
+    MAX_CONCURRENT_SEARCHES: int = _positive_int_env("MAX_CONCURRENT_SEARCHES", 4)
 
     # Embed Colors
     PRIMARY_COLOR: int = 0x738678
@@ -7,6 +7,13 @@ from discord import Embed
 
 from .config import Config
 
+# Colors are fixed at import; bound here to skip the Config lookup per embed
+_PRIMARY_COLOR = Config.PRIMARY_COLOR
+_SUCCESS_COLOR = Config.SUCCESS_COLOR
+_WARNING_COLOR = Config.WARNING_COLOR
+_ERROR_COLOR = Config.ERROR_COLOR
+_INFO_COLOR = Config.INFO_COLOR
+
 
 def create_embed(
     title: str,
@@ -29,7 +36,7 @@ def create_embed(
     embed = Embed(
         title=title,
         description=description,
-        color=color or Config.PRIMARY_COLOR,
+        color=color or _PRIMARY_COLOR,
     )
     if footer:
         embed.set_footer(text=footer)
@@ -38,20 +45,20 @@ def create_embed(
 
 def success_embed(title: str, description: Optional[str] = None) -> Embed:
     """Create a success embed with muted green color."""
-    return create_embed(title, description, color=Config.SUCCESS_COLOR)
+    return create_embed(title, description, color=_SUCCESS_COLOR)
 
 
 def warning_embed(title: str, description: Optional[str] = None) -> Embed:
     """Create a warning embed with soft amber color."""
-    return create_embed(title, description, color=Config.WARNING_COLOR)
+    return create_embed(title, description, color=_WARNING_COLOR)
 
 
 def error_embed(title: str, description: Optional[str] = None) -> Embed:
     """Create an error embed with muted red color."""
-    return create_embed(title, description, color=Config.ERROR_COLOR)
+    return create_embed(title, description, color=_ERROR_COLOR)
 
 
 def info_embed(title: str, description: Optional[str] = None) -> Embed:
     """Create an info embed with neutral slate color."""
-    return create_embed(title, description, color=Config.INFO_COLOR)
+    return create_embed(title, description, color=_INFO_COLOR)
 
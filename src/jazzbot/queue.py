@@ -5,9 +5,10 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 import discord
+import wavelink
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueEntry:
     """Represents a single track in the queue."""
 
@@ -17,6 +18,7 @@ class QueueEntry:
     requester: discord.Member
     identifier: str  # Track identifier for playback
     uri: Optional[str] = None  # Original URI if applicable
+    track: Optional[wavelink.Playable] = None  # Resolved track, replayed without a re-fetch
 
 
 class MusicQueue:
@@ -28,6 +30,7 @@ class MusicQueue:
         self._current_index: int = 0
         self._is_playing: bool = False
         self._is_paused: bool = False
+        self._version: int = 0
 
     @property
     def queue(self) -> List[QueueEntry]:
@@ -49,10 +52,15 @@ class MusicQueue:
         """Check if playback is paused."""
         return self._is_paused
 
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the queue contents or position change."""
+        return self._version
+
     @property
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
-        return len(self._queue) == 0
+        return not self._queue
 
     @property
     def current_track(self) -> Optional[QueueEntry]:
@@ -64,11 +72,13 @@ class MusicQueue:
     def add(self, entry: QueueEntry) -> None:
         """Add a track to the queue."""
         self._queue.append(entry)
+        self._version += 1
 
     def clear(self) -> None:
         """Clear the entire queue."""
         self._queue.clear()
         self._current_index = 0
+        self._version += 1
         self._is_playing = False
         self._is_paused = False
 
@@ -81,6 +91,7 @@ class MusicQueue:
         """
         if self._current_index + 1 < len(self._queue):
             self._current_index += 1
+            self._version += 1
             return self._queue[self._current_index]
         return None
 
@@ -96,6 +107,7 @@ class MusicQueue:
         """
         if 0 <= index < len(self._queue):
             self._current_index = index
+            self._version += 1
             return self._queue[self._current_index]
         return None
 
@@ -104,17 +116,13 @@ class MusicQueue:
         if len(self._queue) <= 1:
             return
 
-        # Save current track
-        current = self._queue[self._current_index]
-
-        # Shuffle remaining tracks
-        remaining = self._queue[self._current_index + 1 :]
+        # Shuffle the tracks after the current one and splice them back
+        # in place; played tracks and the current track are untouched
+        start = self._current_index + 1
+        remaining = self._queue[start:]
         random.shuffle(remaining)
-
-        # Reconstruct queue
-        self._queue = (
-            self._queue[: self._current_index] + [current] + remaining
-        )
+        self._queue[start:] = remaining
+        self._version += 1
 
     def set_playing(self, playing: bool) -> None:
         """Set the playing state."""
@@ -1,22 +1,45 @@
 """Spotify metadata resolution utilities."""
 
 import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 try:
     import spotipy
+    from spotipy.cache_handler import MemoryCacheHandler
     from spotipy.oauth2 import SpotifyClientCredentials
 
     SPOTIFY_AVAILABLE = True
 except ImportError:
     SPOTIFY_AVAILABLE = False
 
+# Matches Spotify links, capturing the resource type and ID
+_SPOTIFY_URL_RE = re.compile(
+    r"https?://(?:open\.)?spotify\.com/(track|playlist|album)/(\w+)"
+)
+
+# Playlist items are fetched in pages of the API's maximum size, trimmed to
+# the fields needed to build search queries
+_PLAYLIST_PAGE_SIZE = 100
+_PLAYLIST_ITEM_FIELDS = "items(track(name,artists(name))),next"
+
+# Resolved playlists are reused for repeat requests within this window
+_PLAYLIST_CACHE_TTL = 300.0  # seconds
+_PLAYLIST_CACHE_SIZE = 64
+
 
 class SpotifyResolver:
     """Resolves Spotify links to searchable track information."""
 
     def __init__(
-        self, client_id: Optional[str] = None, client_secret: Optional[str] = None
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        cache_path: Optional[str] = None,
     ) -> None:
         """
         Initialize Spotify resolver.
@@ -24,34 +47,50 @@ class SpotifyResolver:
         Args:
             client_id: Spotify API client ID
             client_secret: Spotify API client secret
+            cache_path: SQLite file for persisting resolved tracks across restarts
         """
         self.client = None
+        # Opened on first use, from the worker threads that resolve tracks,
+        # so the event loop never blocks on SQLite
+        self._cache_path = cache_path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        # Memoized per track ID; failed lookups raise and are not cached
+        self._track_query = lru_cache(maxsize=1024)(self._fetch_track_query)
+        # Playlists can change, so they expire; resolved from worker threads
+        self._playlist_cache: OrderedDict[str, Tuple[float, List[str]]] = OrderedDict()
+        self._playlist_cache_lock = threading.Lock()
         if SPOTIFY_AVAILABLE and client_id and client_secret:
             try:
+                # Keep the bearer token in memory; the default file cache
+                # re-reads and parses a token file on every API call
                 auth_manager = SpotifyClientCredentials(
-                    client_id=client_id, client_secret=client_secret
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    cache_handler=MemoryCacheHandler(),
                 )
+                # One long-lived client so its HTTP session stays pooled
                 self.client = spotipy.Spotify(auth_manager=auth_manager)
             except Exception:
                 # If Spotify auth fails, continue without it
                 pass
 
-    def is_spotify_url(self, query: str) -> bool:
+    @staticmethod
+    def is_spotify_url(query: str) -> bool:
         """Check if the query is a Spotify URL."""
-        spotify_pattern = r"https?://(open\.)?spotify\.com/(track|playlist|album)/[\w]+"
-        return bool(re.match(spotify_pattern, query))
+        return _SPOTIFY_URL_RE.match(query) is not None
 
-    def extract_spotify_id(self, url: str) -> Optional[Tuple[str, str]]:
+    @staticmethod
+    def extract_spotify_id(url: str) -> Optional[Tuple[str, str]]:
         """
         Extract Spotify ID and type from URL.
 
         Returns:
             Tuple of (type, id) or None if invalid
         """
-        pattern = r"https?://(open\.)?spotify\.com/(track|playlist|album)/([\w]+)"
-        match = re.match(pattern, url)
+        match = _SPOTIFY_URL_RE.match(url)
         if match:
-            return (match.group(2), match.group(3))
+            return (match.group(1), match.group(2))
         return None
 
     def resolve_track(self, url: str) -> Optional[str]:
@@ -72,22 +111,96 @@ class SpotifyResolver:
             if not track_id or track_id[0] != "track":
                 return None
 
-            track = self.client.track(track_id[1])
-            artists = ", ".join([artist["name"] for artist in track["artists"]])
-            track_name = track["name"]
-            return f"{artists} {track_name}"
+            return self._track_query(track_id[1])
         except Exception:
             return None
 
-    def resolve_playlist(self, url: str) -> List[str]:
+    def _fetch_track_query(self, track_id: str) -> str:
+        """Fetch a track from the Spotify API and build its search query."""
+        query = self._load_track_query(track_id)
+        if query is not None:
+            return query
+
+        track = self.client.track(track_id)  # type: ignore
+        artists = ", ".join([artist["name"] for artist in track["artists"]])
+        track_name = track["name"]
+        query = f"{artists} {track_name}"
+        self._store_track_query(track_id, query)
+        return query
+
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent cache on first use; call with the DB lock held."""
+        if self._db is None and self._cache_path:
+            try:
+                db = sqlite3.connect(
+                    self._cache_path, check_same_thread=False, isolation_level=None
+                )
+            except sqlite3.Error:
+                self._cache_path = None  # Run without the persistent cache
+                return None
+            try:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS tracks (id TEXT PRIMARY KEY, query TEXT NOT NULL)"
+                )
+            except sqlite3.Error:
+                db.close()
+                self._cache_path = None
+                return None
+            self._db = db
+        return self._db
+
+    def _load_track_query(self, track_id: str) -> Optional[str]:
+        """Look up a track's search query in the persistent cache."""
+        if not self._cache_path:
+            return None
+
+        try:
+            with self._db_lock:
+                db = self._open_db()
+                if db is None:
+                    return None
+                row = db.execute(
+                    "SELECT query FROM tracks WHERE id = ?", (track_id,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def _store_track_query(self, track_id: str, query: str) -> None:
+        """Save a track's search query to the persistent cache."""
+        if not self._cache_path:
+            return
+
+        try:
+            with self._db_lock:
+                db = self._open_db()
+                if db is not None:
+                    db.execute(
+                        "INSERT OR REPLACE INTO tracks (id, query) VALUES (?, ?)",
+                        (track_id, query),
+                    )
+        except sqlite3.Error:
+            pass  # A failed write only costs a future API call
+
+    def close(self) -> None:
+        """Close the persistent cache; it is not reopened afterwards."""
+        with self._db_lock:
+            self._cache_path = None
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def resolve_playlist(self, url: str, max_tracks: Optional[int] = None) -> List[str]:
         """
         Resolve a Spotify playlist URL to a list of searchable queries.
 
         Args:
             url: Spotify playlist URL
+            max_tracks: Stop paging once more than this many tracks are found
 
         Returns:
-            List of searchable query strings
+            List of searchable query strings; longer than max_tracks if the
+            playlist was cut short, so callers can tell it was truncated
         """
         if not self.client:
             return []
@@ -97,16 +210,48 @@ class SpotifyResolver:
             if not playlist_id or playlist_id[0] != "playlist":
                 return []
 
-            playlist = self.client.playlist(playlist_id[1])
+            with self._playlist_cache_lock:
+                cached = self._playlist_cache.get(playlist_id[1])
+                if cached and cached[0] > time.monotonic():
+                    self._playlist_cache.move_to_end(playlist_id[1])
+                    return cached[1]
+
             tracks = []
+            offset = 0
+
+            # Page through every item, fetching only the fields used for
+            # the search query
+            while True:
+                page = self.client.playlist_items(
+                    playlist_id[1],
+                    fields=_PLAYLIST_ITEM_FIELDS,
+                    limit=_PLAYLIST_PAGE_SIZE,
+                    offset=offset,
+                    additional_types=("track",),
+                )
+                for item in page["items"]:
+                    if item["track"]:
+                        artists = ", ".join(
+                            [artist["name"] for artist in item["track"]["artists"]]
+                        )
+                        track_name = item["track"]["name"]
+                        tracks.append(f"{artists} {track_name}")
+
+                if not page["next"]:
+                    break
+                if max_tracks is not None and len(tracks) > max_tracks:
+                    break
+                offset += _PLAYLIST_PAGE_SIZE
 
-            for item in playlist["tracks"]["items"]:
-                if item["track"]:
-                    artists = ", ".join(
-                        [artist["name"] for artist in item["track"]["artists"]]
+            if tracks:
+                with self._playlist_cache_lock:
+                    self._playlist_cache[playlist_id[1]] = (
+                        time.monotonic() + _PLAYLIST_CACHE_TTL,
+                        tracks,
                     )
-                    track_name = item["track"]["name"]
-                    tracks.append(f"{artists} {track_name}")
+                    self._playlist_cache.move_to_end(playlist_id[1])
+                    if len(self._playlist_cache) > _PLAYLIST_CACHE_SIZE:
+                        self._playlist_cache.popitem(last=False)
 
             return tracks
         except Exception:
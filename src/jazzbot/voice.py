@@ -16,9 +16,8 @@ async def validate_voice_context(
 
     Checks in order:
     1. User is in a voice channel
-    2. Bot can see the channel
-    3. Bot can join the channel
-    4. Bot can speak in the channel
+    2. Bot can join the channel
+    3. Bot can speak in the channel
 
     Args:
         interaction: The Discord interaction
@@ -40,15 +39,7 @@ async def validate_voice_context(
 
     voice_channel: VoiceChannel = user.voice.channel
 
-    # Check 2: Bot must be able to see the channel
-    if not voice_channel:
-        embed = error_embed(
-            "Channel Not Visible",
-            "I cannot see the voice channel you're in.",
-        )
-        return False, embed, None
-
-    # Check 3: Bot must be able to join the channel
+    # Check 2: Bot must be able to join the channel
     permissions = voice_channel.permissions_for(interaction.guild.me)  # type: ignore
     if not permissions.connect:
         embed = error_embed(
@@ -57,7 +48,7 @@ async def validate_voice_context(
         )
         return False, embed, None
 
-    # Check 4: Bot must be able to speak in the channel
+    # Check 3: Bot must be able to speak in the channel
     if not permissions.speak:
         embed = error_embed(
             "Cannot Speak in Channel",